@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Callable
+from xml.sax.saxutils import escape
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy renderer is the fallback.
+    njit = None
+    prange = range
+
 ROOT = Path(__file__).resolve().parents[1]
 ASSETS = ROOT / "assets" / "images"
 ICON_SET = ASSETS / "icon-set"
 
 SIZE = 512
-SCALE = 4
-CANVAS = SIZE * SCALE
+# Shapes are rasterized as signed distance fields, which antialias exactly at
+# the output size, so icons are drawn directly in output pixels with no
+# supersample or resample.
 
 WHITE = (243, 246, 252, 255)
 SOFT_WHITE = (220, 228, 242, 255)
@@ -19,273 +31,682 @@ BLUE = (10, 132, 255, 255)
 ORANGE = (255, 159, 10, 255)
 RED = (255, 69, 58, 255)
 GREEN = (52, 199, 89, 255)
+PERIWINKLE = (120, 120, 255, 210)
+
+# Shapes refer to colors by their index in this table.
+PALETTE = (WHITE, SOFT_WHITE, BLUE, ORANGE, RED, GREEN, PERIWINKLE)
+_PALETTE = np.array(PALETTE, np.uint8)
+
+# Shape table layout: one float32 row per primitive.
+#   kind, p0..p31 (kind-specific geometry), width (0 = filled), color id
+KIND_ELLIPSE = 0  # cx, cy, rx, ry
+KIND_ARC = 1  # cx, cy, rx, ry, piece count, then 3 x (nx, ny, c) per piece
+KIND_SEGMENT = 2  # x0, y0, x1, y1 (butt ends)
+KIND_TRIANGLE = 3  # x0, y0, x1, y1, x2, y2
+KIND_ROUNDED_RECT = 4  # cx, cy, half width, half height, radius
+# An arc splits into at most three pieces, one per half-ellipse it touches.
+ARC_PIECES = 3
+SHAPE_PARAMS = 5 + 9 * ARC_PIECES
+SHAPE_COLUMNS = SHAPE_PARAMS + 3
+
+
+def _jit(fn):
+    # The SDF helpers take scalars inside the Numba kernel and whole
+    # coordinate grids in the NumPy renderer, so they only use ufuncs.
+    return njit(fastmath=True, cache=True)(fn) if njit is not None else fn
+
+
+@_jit
+def _sdf_ellipse(px, py, cx, cy, rx, ry):
+    # (k0 - 1) * k0 / k1 approximates the distance to the ellipse; k0 / k1 is
+    # bounded by the radii, which also keeps the centre pixel well defined.
+    ux = (px - cx) / rx
+    uy = (py - cy) / ry
+    k0 = np.sqrt(ux * ux + uy * uy)
+    k1 = np.sqrt(ux * ux / (rx * rx) + uy * uy / (ry * ry))
+    ratio = np.minimum(np.maximum(k0 / np.maximum(k1, 1e-9), min(rx, ry)), max(rx, ry))
+    return (k0 - 1.0) * ratio
+
+
+@_jit
+def _sdf_arc_piece(px, py, p, offset):
+    # Intersection of three half-planes (n . xy = c, negative inside).
+    d = px * p[offset] + py * p[offset + 1] - p[offset + 2]
+    d = np.maximum(d, px * p[offset + 3] + py * p[offset + 4] - p[offset + 5])
+    return np.maximum(d, px * p[offset + 6] + py * p[offset + 7] - p[offset + 8])
+
+
+@_jit
+def _sdf_arc_cuts(px, py, p):
+    # An arc is the union of its pieces on either side of the major axis.
+    # With no pieces recorded the arc covers nothing.
+    d = _sdf_arc_piece(px, py, p, 5) + (1e9 if p[4] < 1 else 0.0)
+    for piece in range(1, int(p[4])):
+        d = np.minimum(d, _sdf_arc_piece(px, py, p, 5 + 9 * piece))
+    return d
+
+
+@_jit
+def _sdf_segment(px, py, x0, y0, x1, y1, width):
+    dx = x1 - x0
+    dy = y1 - y0
+    length = np.sqrt(dx * dx + dy * dy)
+    ux = dx / length
+    uy = dy / length
+    rx = px - x0
+    ry = py - y0
+    along = rx * ux + ry * uy
+    across = np.abs(ry * ux - rx * uy)
+    return np.maximum(across - 0.5 * width, np.maximum(-along, along - length))
+
+
+@_jit
+def _sdf_triangle(px, py, x0, y0, x1, y1, x2, y2):
+    e0x, e0y = x1 - x0, y1 - y0
+    e1x, e1y = x2 - x1, y2 - y1
+    e2x, e2y = x0 - x2, y0 - y2
+    v0x, v0y = px - x0, py - y0
+    v1x, v1y = px - x1, py - y1
+    v2x, v2y = px - x2, py - y2
+    t0 = np.minimum(np.maximum((v0x * e0x + v0y * e0y) / (e0x * e0x + e0y * e0y), 0.0), 1.0)
+    t1 = np.minimum(np.maximum((v1x * e1x + v1y * e1y) / (e1x * e1x + e1y * e1y), 0.0), 1.0)
+    t2 = np.minimum(np.maximum((v2x * e2x + v2y * e2y) / (e2x * e2x + e2y * e2y), 0.0), 1.0)
+    q0x, q0y = v0x - e0x * t0, v0y - e0y * t0
+    q1x, q1y = v1x - e1x * t1, v1y - e1y * t1
+    q2x, q2y = v2x - e2x * t2, v2y - e2y * t2
+    s = np.sign(e0x * e2y - e0y * e2x)
+    dist = np.minimum(np.minimum(q0x * q0x + q0y * q0y, q1x * q1x + q1y * q1y), q2x * q2x + q2y * q2y)
+    side = np.minimum(
+        np.minimum(s * (v0x * e0y - v0y * e0x), s * (v1x * e1y - v1y * e1x)),
+        s * (v2x * e2y - v2y * e2x),
+    )
+    return -np.sqrt(dist) * np.sign(side)
+
+
+@_jit
+def _sdf_rounded_rect(px, py, cx, cy, hx, hy, radius):
+    qx = np.abs(px - cx) - hx + radius
+    qy = np.abs(py - cy) - hy + radius
+    outside = np.sqrt(np.maximum(qx, 0.0) ** 2 + np.maximum(qy, 0.0) ** 2)
+    return outside + np.minimum(np.maximum(qx, qy), 0.0) - radius
+
+
+@_jit
+def _sdf(shape: np.ndarray, px, py):
+    kind = int(shape[0])
+    p = shape[1 : SHAPE_PARAMS + 1]
+    width = shape[SHAPE_PARAMS + 1]
+    if kind == KIND_SEGMENT:
+        return _sdf_segment(px, py, p[0], p[1], p[2], p[3], width)
+    if kind == KIND_ELLIPSE or kind == KIND_ARC:
+        d = _sdf_ellipse(px, py, p[0], p[1], p[2], p[3])
+        if width > 0 and width < min(p[2], p[3]):
+            # Ellipse outlines are the band between the outer ellipse and one
+            # inset by `width`, as ImageDraw draws them; wider strokes fill it.
+            d = np.maximum(d, -_sdf_ellipse(px, py, p[0], p[1], p[2] - width, p[3] - width))
+    else:
+        if kind == KIND_TRIANGLE:
+            d = _sdf_triangle(px, py, p[0], p[1], p[2], p[3], p[4], p[5])
+        else:
+            d = _sdf_rounded_rect(px, py, p[0], p[1], p[2], p[3], p[4])
+        if width > 0:
+            # Outlines are inset like ImageDraw's: a band of `width` inside the edge.
+            d = np.maximum(d, -d - width)
+    if kind == KIND_ARC:
+        d = np.maximum(d, _sdf_arc_cuts(px, py, p))
+    return d
+
+
+def _render_kernel(shapes: np.ndarray, palette: np.ndarray) -> np.ndarray:
+    # Fused per-pixel composite of every shape; rows run in parallel threads.
+    out = np.empty((SIZE, SIZE, 4), np.uint8)
+    for y in prange(SIZE):
+        py = y + 0.5
+        for x in range(SIZE):
+            px = x + 0.5
+            r = g = b = a = 0.0
+            for i in range(shapes.shape[0]):
+                shape = shapes[i]
+                rgba = palette[int(shape[-1])]
+                coverage = min(max(0.5 - _sdf(shape, px, py), 0.0), 1.0) * rgba[3] / 255.0
+                if coverage > 0.0:
+                    keep = 1.0 - coverage
+                    r = r * keep + coverage * rgba[0] / 255.0
+                    g = g * keep + coverage * rgba[1] / 255.0
+                    b = b * keep + coverage * rgba[2] / 255.0
+                    a = a * keep + coverage
+            if a * 255.0 >= 0.5:
+                r, g, b = r / a, g / a, b / a
+            else:
+                r = g = b = a = 0.0
+            out[y, x, 0] = np.uint8(round(r * 255.0))
+            out[y, x, 1] = np.uint8(round(g * 255.0))
+            out[y, x, 2] = np.uint8(round(b * 255.0))
+            out[y, x, 3] = np.uint8(round(a * 255.0))
+    return out
+
+
+if njit is not None:
+    # Compile eagerly (and cache on disk) so the JIT cost isn't paid per icon.
+    _render_kernel = njit("uint8[:,:,:](float32[:,:], uint8[:,:])", parallel=True, fastmath=True, cache=True)(_render_kernel)
+
+
+# Pixel-centre coordinates and the premultiplied accumulator are shared by
+# every icon the NumPy renderer draws rather than reallocated per call.
+_YY, _XX = np.mgrid[0:SIZE, 0:SIZE].astype(np.float32) + 0.5
+_SCRATCH = np.empty((SIZE, SIZE, 4), np.float32)
+
+
+def _render_numpy(shapes: np.ndarray) -> np.ndarray:
+    # Premultiplied-ready colors (alpha channel 1) and per-color opacity.
+    colors = _PALETTE.astype(np.float32) / 255.0
+    opacity = colors[:, 3].copy()
+    colors[:, 3] = 1.0
+    out = _SCRATCH
+    out.fill(0.0)
+    for shape in shapes:
+        color_id = int(shape[-1])
+        coverage = np.clip(0.5 - _sdf(shape, _XX, _YY), 0.0, 1.0) * opacity[color_id]
+        color = colors[color_id]
+        out *= 1.0 - coverage[..., None]
+        out += coverage[..., None] * color
+    # Pixels whose alpha rounds to zero keep premultiplied channels that also
+    # round to zero, so unpremultiplying in place can skip them.
+    alpha = out[..., 3:]
+    np.divide(out[..., :3], alpha, out=out[..., :3], where=alpha * 255.0 >= 0.5)
+    return np.rint(out * 255.0).astype(np.uint8)
+
+
+def _render(shapes: np.ndarray) -> np.ndarray:
+    if njit is not None:
+        return _render_kernel(shapes, _PALETTE)
+    return _render_numpy(shapes)
+
+
+def _half_plane(a, b, inside) -> list[float]:
+    # Unit normal and offset of the line through a and b, oriented so that
+    # the `inside` point has a negative signed distance.
+    nx, ny = b[1] - a[1], a[0] - b[0]
+    norm = np.hypot(nx, ny)
+    nx, ny = nx / norm, ny / norm
+    if nx * (inside[0] - a[0]) + ny * (inside[1] - a[1]) > 0:
+        nx, ny = -nx, -ny
+    return [nx, ny, nx * a[0] + ny * a[1]]
+
+
+def _arc_cut(cx: float, cy: float, rx: float, ry: float, angle: float, towards: int) -> list[float]:
+    # Half-plane bounded by the ellipse normal at a parametric angle, keeping
+    # the side the angle moves towards (1) or away from (-1).
+    t = np.radians(angle)
+    px, py = cx + rx * np.cos(t), cy + ry * np.sin(t)
+    tx, ty = -rx * np.sin(t) * towards, ry * np.cos(t) * towards
+    return _half_plane((px, py), (px + ty, py - tx), (px + tx, py + ty))
+
+
+def _clip_polygon(points, plane) -> list[tuple[float, float]]:
+    # Keep the part of a convex polygon where n . xy <= c.
+    nx, ny, c = plane
+    kept = []
+    for (ax, ay), (bx, by) in zip(points, points[1:] + points[:1]):
+        da, db = nx * ax + ny * ay - c, nx * bx + ny * by - c
+        if da <= 0:
+            kept.append((ax, ay))
+        if da * db < 0:
+            t = da / (da - db)
+            kept.append((ax + (bx - ax) * t, ay + (by - ay) * t))
+    return kept
+
+
+def _ellipse_path(cx: float, cy: float, rx: float, ry: float) -> str:
+    return (
+        f"M{_num(cx - rx)} {_num(cy)} A{_num(rx)} {_num(ry)} 0 1 0 {_num(cx + rx)} {_num(cy)} "
+        f"A{_num(rx)} {_num(ry)} 0 1 0 {_num(cx - rx)} {_num(cy)} Z"
+    )
+
+
+def _num(value: float) -> str:
+    return f"{float(value):.2f}".rstrip("0").rstrip(".")
+
+
+def _points(points) -> str:
+    return " ".join(f"{_num(x)},{_num(y)}" for x, y in points)
+
+
+def _paint(color, stroke: float = 0) -> str:
+    r, g, b, a = color
+    rgb = f"rgb({r},{g},{b})"
+    if stroke:
+        paint = f'fill="none" stroke="{rgb}" stroke-width="{_num(stroke)}"'
+        return paint if a == 255 else f'{paint} stroke-opacity="{_num(a / 255)}"'
+    return f'fill="{rgb}"' if a == 255 else f'fill="{rgb}" fill-opacity="{_num(a / 255)}"'
+
+
+def _inset_triangle(points, distance: float) -> list[tuple[float, float]]:
+    # Offsetting a triangle's edges inward is a scaling about its incenter.
+    (ax, ay), (bx, by), (cx, cy) = points
+    a = np.hypot(bx - cx, by - cy)
+    b = np.hypot(cx - ax, cy - ay)
+    c = np.hypot(ax - bx, ay - by)
+    perimeter = a + b + c
+    ix = (a * ax + b * bx + c * cx) / perimeter
+    iy = (a * ay + b * by + c * cy) / perimeter
+    inradius = abs((bx - ax) * (cy - ay) - (cx - ax) * (by - ay)) / perimeter
+    scale = max(inradius - distance, 0) / inradius
+    return [(ix + (x - ix) * scale, iy + (y - iy) * scale) for x, y in points]
+
+
+class _Canvas:
+    """Records ImageDraw-style primitives into a shape table for SDF rendering.
+
+    The same primitives are kept as SVG elements so every icon also ships as a
+    scalable vector. ImageDraw insets outlines, so SVG strokes are centred on
+    geometry shrunk by half the stroke width.
+    """
+
+    def __init__(self) -> None:
+        self.shapes: list[tuple[float, ...]] = []
+        self.overlays: list[Image.Image] = []
+        self.elements: list[str] = []
+
+    def _add(self, kind: int, geometry: tuple[float, ...], width: float, color) -> None:
+        if color is None or color[3] == 0:
+            return
+        params = tuple(geometry) + (0.0,) * (SHAPE_PARAMS - len(geometry))
+        self.shapes.append((kind, *params, width, PALETTE.index(color)))
+
+    def _element(self, tag: str, color, stroke: float = 0, **attrs) -> None:
+        if color is None or color[3] == 0:
+            return
+        attributes = " ".join(f'{name.replace("_", "-")}="{value}"' for name, value in attrs.items())
+        self.elements.append(f"<{tag} {attributes} {_paint(color, stroke)}/>")
+
+    def ellipse(self, xy, fill=None, outline=None, width: int = 1) -> None:
+        x0, y0, x1, y1 = xy
+        geometry = ((x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2)
+        self._add(KIND_ELLIPSE, geometry, 0, fill)
+        self._add(KIND_ELLIPSE, geometry, width, outline)
+        cx, cy, rx, ry = (_num(v) for v in geometry)
+        self._element("ellipse", fill, cx=cx, cy=cy, rx=rx, ry=ry)
+        inset = width / 2
+        self._element("ellipse", outline, width, cx=cx, cy=cy, rx=_num(geometry[2] - inset), ry=_num(geometry[3] - inset))
+
+    def arc(self, xy, start: float, end: float, fill, width: int = 1) -> None:
+        if end - start >= 360:
+            self.ellipse(xy, outline=fill, width=width)
+            return
+        x0, y0, x1, y1 = xy
+        cx, cy, rx, ry = (x0 + x1) / 2, (y0 + y1) / 2, (x1 - x0) / 2, (y1 - y0) / 2
+        # Like ImageDraw, arcs are clipped separately on each side of the major
+        # axis, with ends cut along the ellipse normal, so strokes wider than
+        # the minor radius stop at the axis instead of running into a wedge.
+        # As in ImageDraw, `end` wraps forward to the first angle at or after
+        # `start`, so equal angles draw nothing.
+        first = start % 360
+        last = first + (end - start) % 360
+        pieces: list[list[float]] = []
+        for half in (0, 180) if rx >= ry else (-90, 90):
+            side = np.radians(half + 90)
+            axis = _half_plane((cx, cy), (cx - np.sin(side), cy + np.cos(side)), (cx + np.cos(side), cy + np.sin(side)))
+            for lap in (-360, 0, 360):
+                lo, hi = max(first, half + lap), min(last, half + lap + 180)
+                if lo < hi:
+                    pieces.append(_arc_cut(cx, cy, rx, ry, lo, 1) + _arc_cut(cx, cy, rx, ry, hi, -1) + axis)
+        if not pieces:
+            return
+        self._add(KIND_ARC, (cx, cy, rx, ry, len(pieces), *(v for piece in pieces for v in piece)), width, fill)
+        # The same band in SVG: the ellipse ring clipped to the pieces.
+        if fill is None or fill[3] == 0:
+            return
+        ring = _ellipse_path(cx, cy, rx, ry)
+        if width < min(rx, ry):
+            ring += _ellipse_path(cx, cy, rx - width, ry - width)
+        clip = f"arc{len(self.elements)}"
+        bounds = [(x0 - 1, y0 - 1), (x1 + 1, y0 - 1), (x1 + 1, y1 + 1), (x0 - 1, y1 + 1)]
+        polygons = []
+        for piece in pieces:
+            polygon = bounds
+            for plane in (piece[0:3], piece[3:6], piece[6:9]):
+                polygon = _clip_polygon(polygon, plane)
+            polygons.append(f'<polygon points="{_points(polygon)}"/>')
+        self.elements.append(f'<clipPath id="{clip}">{"".join(polygons)}</clipPath>')
+        self._element("path", fill, d=ring, fill_rule="evenodd", clip_path=f"url(#{clip})")
+
+    def line(self, xy, fill, width: int = 1, joint: str | None = None) -> None:
+        points = list(zip(xy[0::2], xy[1::2]))
+        for (x0, y0), (x1, y1) in zip(points, points[1:]):
+            # Repeated points add nothing in ImageDraw and have no direction.
+            if (x0, y0) != (x1, y1):
+                self._add(KIND_SEGMENT, (x0, y0, x1, y1), width, fill)
+        if joint == "curve":
+            for x, y in points[1:-1]:
+                self._add(KIND_ELLIPSE, (x, y, width / 2, width / 2), 0, fill)
+        linejoin = "round" if joint == "curve" else "bevel"
+        self._element("polyline", fill, width, points=_points(points), stroke_linejoin=linejoin)
+
+    def lines(self, segments, fill, width: int = 1) -> None:
+        # Disjoint segments sharing one paint, emitted as a single SVG path.
+        path = []
+        for x0, y0, x1, y1 in segments:
+            if (x0, y0) == (x1, y1):
+                continue
+            self._add(KIND_SEGMENT, (x0, y0, x1, y1), width, fill)
+            path.append(f"M{_num(x0)} {_num(y0)}L{_num(x1)} {_num(y1)}")
+        if path:
+            self._element("path", fill, width, d="".join(path))
+
+    def polygon(self, xy, fill=None, outline=None, width: int = 1) -> None:
+        if len(xy) != 3:
+            raise ValueError("only triangles are supported")
+        geometry = tuple(c for point in xy for c in point)
+        self._add(KIND_TRIANGLE, geometry, 0, fill)
+        self._add(KIND_TRIANGLE, geometry, width, outline)
+        self._element("polygon", fill, points=_points(xy))
+        self._element("polygon", outline, width, points=_points(_inset_triangle(xy, width / 2)))
+
+    def rounded_rectangle(self, xy, radius: int, fill=None, outline=None, width: int = 1) -> None:
+        x0, y0, x1, y1 = xy
+        hx, hy = (x1 - x0) / 2, (y1 - y0) / 2
+        geometry = ((x0 + x1) / 2, (y0 + y1) / 2, hx, hy, min(radius, hx, hy))
+        self._add(KIND_ROUNDED_RECT, geometry, 0, fill)
+        self._add(KIND_ROUNDED_RECT, geometry, width, outline)
+        radius = geometry[4]
+        self._element("rect", fill, x=_num(x0), y=_num(y0), width=_num(x1 - x0), height=_num(y1 - y0), rx=_num(radius))
+        inset = width / 2
+        self._element(
+            "rect",
+            outline,
+            width,
+            x=_num(x0 + inset),
+            y=_num(y0 + inset),
+            width=_num(x1 - x0 - width),
+            height=_num(y1 - y0 - width),
+            rx=_num(max(radius - inset, 0)),
+        )
+
+    def text(self, xy, text: str, fill, font) -> None:
+        # Glyphs are not analytic shapes; FreeType antialiases them onto a layer
+        # that is composited over the rendered shapes.
+        layer = Image.new("RGBA", (SIZE, SIZE), (0, 0, 0, 0))
+        ImageDraw.Draw(layer, "RGBA").text(xy, text, fill=fill, font=font)
+        self.overlays.append(layer)
+        # The SVG names the same font but falls back to the viewer's sans-serif.
+        x, y = xy
+        family = escape(font.getname()[0], {'"': "&quot;"})
+        self.elements.append(
+            f'<text x="{_num(x)}" y="{_num(y)}" font-family="{family}, sans-serif" font-size="{_num(font.size)}" '
+            f'dominant-baseline="text-before-edge" {_paint(fill)}>{escape(text)}</text>'
+        )
+
+    def render(self) -> Image.Image:
+        table = np.array(self.shapes, np.float32).reshape(-1, SHAPE_COLUMNS)
+        img = Image.fromarray(_render(table), "RGBA")
+        for layer in self.overlays:
+            img.alpha_composite(layer)
+        return img
+
+    def svg(self) -> str:
+        body = "\n  ".join(self.elements)
+        return (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{SIZE}" height="{SIZE}" viewBox="0 0 {SIZE} {SIZE}">\n'
+            f"  {body}\n</svg>\n"
+        )
+
+
+def _new() -> _Canvas:
+    return _Canvas()
+
+
+def _save(canvas: _Canvas, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    canvas.render().save(target)
+    target.with_suffix(".svg").write_text(canvas.svg())
 
 
-def _w(value: float) -> int:
-    return int(value * SCALE)
-
-
-def _stroke(base: float) -> int:
-    return _w(base)
-
-
-def _new() -> tuple[Image.Image, ImageDraw.ImageDraw]:
-    img = Image.new("RGBA", (CANVAS, CANVAS), (0, 0, 0, 0))
-    return img, ImageDraw.Draw(img, "RGBA")
-
-
-def _save(img: Image.Image, target: Path) -> None:
-    target.parent.mkdir(parents=True, exist_ok=True)
-    out = img.resize((SIZE, SIZE), Image.Resampling.LANCZOS)
-    out.save(target)
+@lru_cache(maxsize=None)
+def _default_font(size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.load_default(size=size)
 
 
-def _rounded_rect(draw: ImageDraw.ImageDraw, xy: tuple[int, int, int, int], radius: int, outline, width: int) -> None:
+def _rounded_rect(draw: _Canvas, xy: tuple[int, int, int, int], radius: int, outline, width: int) -> None:
     draw.rounded_rectangle(xy, radius=radius, outline=outline, width=width)
 
 
-def icon_singing() -> Image.Image:
-    img, d = _new()
-    s = _stroke(42)
-    d.ellipse((_w(180), _w(90), _w(332), _w(250)), outline=WHITE, width=s)
-    d.arc((_w(180), _w(154), _w(332), _w(316)), start=20, end=160, fill=WHITE, width=s)
-    d.line((_w(256), _w(250), _w(256), _w(372)), fill=WHITE, width=s)
-    d.arc((_w(174), _w(356), _w(338), _w(432)), start=200, end=340, fill=WHITE, width=s)
-    d.line((_w(384), _w(180), _w(422), _w(164), _w(462), _w(180), _w(500), _w(164)), fill=ORANGE, width=_stroke(24), joint="curve")
-    return img
-
-
-def icon_lyrics() -> Image.Image:
-    img, d = _new()
-    s = _stroke(34)
-    _rounded_rect(d, (_w(108), _w(80), _w(336), _w(426)), radius=_w(28), outline=WHITE, width=s)
-    d.line((_w(142), _w(170), _w(280), _w(170)), fill=SOFT_WHITE, width=_stroke(26))
-    d.line((_w(142), _w(230), _w(280), _w(230)), fill=SOFT_WHITE, width=_stroke(26))
-    d.line((_w(142), _w(290), _w(240), _w(290)), fill=SOFT_WHITE, width=_stroke(26))
-    d.line((_w(330), _w(174), _w(426), _w(142), _w(426), _w(288)), fill=BLUE, width=_stroke(30), joint="curve")
-    d.ellipse((_w(298), _w(300), _w(352), _w(354)), fill=BLUE)
-    d.ellipse((_w(394), _w(268), _w(448), _w(322)), fill=BLUE)
-    return img
-
-
-def icon_sessions() -> Image.Image:
-    img, d = _new()
-    s = _stroke(30)
-    _rounded_rect(d, (_w(130), _w(132), _w(318), _w(390)), radius=_w(24), outline=SOFT_WHITE, width=s)
-    _rounded_rect(d, (_w(176), _w(96), _w(364), _w(354)), radius=_w(24), outline=WHITE, width=s)
-    _rounded_rect(d, (_w(222), _w(62), _w(410), _w(320)), radius=_w(24), outline=WHITE, width=s)
-    d.line((_w(252), _w(142), _w(374), _w(142)), fill=SOFT_WHITE, width=_stroke(20))
-    d.line((_w(252), _w(198), _w(360), _w(198)), fill=SOFT_WHITE, width=_stroke(20))
-    d.line((_w(252), _w(254), _w(338), _w(254)), fill=SOFT_WHITE, width=_stroke(20))
-    return img
-
-
-def icon_profile() -> Image.Image:
-    img, d = _new()
-    s = _stroke(34)
-    d.ellipse((_w(186), _w(82), _w(326), _w(222)), outline=WHITE, width=s)
-    d.rounded_rectangle((_w(104), _w(236), _w(408), _w(412)), radius=_w(90), outline=WHITE, width=s)
-    return img
-
-
-def icon_live_mode() -> Image.Image:
-    img, d = _new()
-    s = _stroke(32)
-    _rounded_rect(d, (_w(84), _w(138), _w(430), _w(346)), radius=_w(50), outline=WHITE, width=s)
-    d.ellipse((_w(372), _w(172), _w(420), _w(220)), fill=ORANGE)
-    d.line((_w(158), _w(244), _w(356), _w(244)), fill=SOFT_WHITE, width=_stroke(24))
-    return img
-
-
-def icon_lyrics_sync() -> Image.Image:
-    img, d = _new()
-    s = _stroke(28)
-    _rounded_rect(d, (_w(194), _w(174), _w(318), _w(334)), radius=_w(20), outline=WHITE, width=s)
-    d.arc((_w(70), _w(70), _w(442), _w(442)), start=35, end=170, fill=WHITE, width=s)
-    d.polygon([(_w(420), _w(120)), (_w(462), _w(120)), (_w(438), _w(160))], fill=WHITE)
-    d.arc((_w(70), _w(70), _w(442), _w(442)), start=215, end=350, fill=WHITE, width=s)
-    d.polygon([(_w(92), _w(394)), (_w(132), _w(394)), (_w(108), _w(430))], fill=WHITE)
-    return img
-
-
-def icon_feedback(high: bool) -> Image.Image:
-    img, d = _new()
-    base_y = _w(390)
-    bar_w = _w(54)
-    gap = _w(34)
-    x = _w(112)
-    heights = [_w(120), _w(170), _w(230), _w(280)]
+def _draw_mic(d: _Canvas, head: tuple[int, int, int, int], cradle_bottom: int, stem: tuple[int, int], stand_top: int, width: int) -> None:
+    x0, _, x1, _ = head
+    d.ellipse(head, outline=WHITE, width=width)
+    d.arc((x0, 154, x1, cradle_bottom), start=20, end=160, fill=WHITE, width=width)
+    d.line((256, stem[0], 256, stem[1]), fill=WHITE, width=width)
+    d.arc((174, stand_top, 338, stand_top + 76), start=200, end=340, fill=WHITE, width=width)
+
+
+def icon_singing() -> _Canvas:
+    d = _new()
+    _draw_mic(d, (180, 90, 332, 250), cradle_bottom=316, stem=(250, 372), stand_top=356, width=42)
+    d.line((384, 180, 422, 164, 462, 180, 500, 164), fill=ORANGE, width=24, joint="curve")
+    return d
+
+
+def icon_lyrics() -> _Canvas:
+    d = _new()
+    s = 34
+    _rounded_rect(d, (108, 80, 336, 426), radius=28, outline=WHITE, width=s)
+    d.lines([(142, 170, 280, 170), (142, 230, 280, 230), (142, 290, 240, 290)], fill=SOFT_WHITE, width=26)
+    d.line((330, 174, 426, 142, 426, 288), fill=BLUE, width=30, joint="curve")
+    d.ellipse((298, 300, 352, 354), fill=BLUE)
+    d.ellipse((394, 268, 448, 322), fill=BLUE)
+    return d
+
+
+def icon_sessions() -> _Canvas:
+    d = _new()
+    s = 30
+    _rounded_rect(d, (130, 132, 318, 390), radius=24, outline=SOFT_WHITE, width=s)
+    _rounded_rect(d, (176, 96, 364, 354), radius=24, outline=WHITE, width=s)
+    _rounded_rect(d, (222, 62, 410, 320), radius=24, outline=WHITE, width=s)
+    d.lines([(252, 142, 374, 142), (252, 198, 360, 198), (252, 254, 338, 254)], fill=SOFT_WHITE, width=20)
+    return d
+
+
+def icon_profile() -> _Canvas:
+    d = _new()
+    s = 34
+    d.ellipse((186, 82, 326, 222), outline=WHITE, width=s)
+    d.rounded_rectangle((104, 236, 408, 412), radius=90, outline=WHITE, width=s)
+    return d
+
+
+def icon_live_mode() -> _Canvas:
+    d = _new()
+    s = 32
+    _rounded_rect(d, (84, 138, 430, 346), radius=50, outline=WHITE, width=s)
+    d.ellipse((372, 172, 420, 220), fill=ORANGE)
+    d.line((158, 244, 356, 244), fill=SOFT_WHITE, width=24)
+    return d
+
+
+def icon_lyrics_sync() -> _Canvas:
+    d = _new()
+    s = 28
+    _rounded_rect(d, (194, 174, 318, 334), radius=20, outline=WHITE, width=s)
+    d.arc((70, 70, 442, 442), start=35, end=170, fill=WHITE, width=s)
+    d.polygon([(420, 120), (462, 120), (438, 160)], fill=WHITE)
+    d.arc((70, 70, 442, 442), start=215, end=350, fill=WHITE, width=s)
+    d.polygon([(92, 394), (132, 394), (108, 430)], fill=WHITE)
+    return d
+
+
+def icon_feedback(high: bool) -> _Canvas:
+    d = _new()
+    base_y = 390
+    bar_w = 54
+    gap = 34
+    x = 112
+    heights = [120, 170, 230, 280]
     if not high:
-        heights = [_w(260), _w(210), _w(160), _w(110)]
+        heights = [260, 210, 160, 110]
     for i, h in enumerate(heights):
         color = ORANGE if (high and i == 3) or (not high and i == 0) else SOFT_WHITE
-        d.rounded_rectangle((x, base_y - h, x + bar_w, base_y), radius=_w(16), fill=color)
+        d.rounded_rectangle((x, base_y - h, x + bar_w, base_y), radius=16, fill=color)
         x += bar_w + gap
-    return img
-
-
-def icon_mindfulness_voice() -> Image.Image:
-    img, d = _new()
-    s = _stroke(34)
-    d.ellipse((_w(182), _w(92), _w(330), _w(248)), outline=WHITE, width=s)
-    d.arc((_w(182), _w(154), _w(330), _w(308)), start=20, end=160, fill=WHITE, width=s)
-    d.line((_w(256), _w(246), _w(256), _w(350)), fill=WHITE, width=s)
-    d.arc((_w(174), _w(336), _w(338), _w(412)), start=200, end=340, fill=WHITE, width=s)
-    d.line((_w(350), _w(250), _w(382), _w(214), _w(414), _w(266), _w(452), _w(228), _w(490), _w(246)), fill=ORANGE, width=_stroke(24), joint="curve")
-    return img
-
-
-def icon_language_accent() -> Image.Image:
-    img, d = _new()
-    s = _stroke(26)
-    d.ellipse((_w(90), _w(84), _w(358), _w(352)), outline=WHITE, width=s)
-    d.arc((_w(120), _w(84), _w(328), _w(352)), start=90, end=270, fill=SOFT_WHITE, width=_stroke(20))
-    d.arc((_w(140), _w(84), _w(308), _w(352)), start=90, end=270, fill=SOFT_WHITE, width=_stroke(16))
-    d.line((_w(90), _w(218), _w(358), _w(218)), fill=SOFT_WHITE, width=_stroke(20))
-    d.rounded_rectangle((_w(292), _w(148), _w(456), _w(274)), radius=_w(46), outline=WHITE, width=s)
-    d.polygon([(_w(330), _w(274)), (_w(300), _w(308)), (_w(334), _w(292))], fill=WHITE)
+    return d
+
+
+def icon_mindfulness_voice() -> _Canvas:
+    d = _new()
+    _draw_mic(d, (182, 92, 330, 248), cradle_bottom=308, stem=(246, 350), stand_top=336, width=34)
+    d.line((350, 250, 382, 214, 414, 266, 452, 228, 490, 246), fill=ORANGE, width=24, joint="curve")
+    return d
+
+
+def icon_language_accent() -> _Canvas:
+    d = _new()
+    s = 26
+    d.ellipse((90, 84, 358, 352), outline=WHITE, width=s)
+    d.arc((120, 84, 328, 352), start=90, end=270, fill=SOFT_WHITE, width=20)
+    d.arc((140, 84, 308, 352), start=90, end=270, fill=SOFT_WHITE, width=16)
+    d.line((90, 218, 358, 218), fill=SOFT_WHITE, width=20)
+    d.rounded_rectangle((292, 148, 456, 274), radius=46, outline=WHITE, width=s)
+    d.polygon([(330, 274), (300, 308), (334, 292)], fill=WHITE)
     for x in (338, 374, 410):
-        d.ellipse((_w(x), _w(198), _w(x + 20), _w(218)), fill=ORANGE)
-    return img
-
-
-def icon_howto() -> Image.Image:
-    img, d = _new()
-    s = _stroke(30)
-    _rounded_rect(d, (_w(110), _w(92), _w(402), _w(424)), radius=_w(34), outline=WHITE, width=s)
-    _rounded_rect(d, (_w(198), _w(58), _w(314), _w(118)), radius=_w(18), outline=WHITE, width=_stroke(24))
-    d.line((_w(156), _w(192), _w(292), _w(192)), fill=SOFT_WHITE, width=_stroke(20))
-    d.line((_w(156), _w(246), _w(272), _w(246)), fill=SOFT_WHITE, width=_stroke(20))
-    d.line((_w(156), _w(300), _w(292), _w(300)), fill=SOFT_WHITE, width=_stroke(20))
-    d.ellipse((_w(286), _w(174), _w(404), _w(292)), outline=WHITE, width=_stroke(20))
-    d.polygon([(_w(330), _w(208)), (_w(330), _w(258)), (_w(372), _w(233))], fill=BLUE)
-    d.text((_w(382), _w(94)), "?", fill=ORANGE, font=ImageFont.load_default(size=_w(82)))
-    return img
-
-
-def icon_record() -> Image.Image:
-    img, d = _new()
-    d.ellipse((_w(108), _w(108), _w(404), _w(404)), outline=RED, width=_stroke(36))
-    d.ellipse((_w(194), _w(194), _w(318), _w(318)), fill=RED)
-    return img
-
-
-def icon_stop() -> Image.Image:
-    img, d = _new()
-    d.rounded_rectangle((_w(128), _w(128), _w(384), _w(384)), radius=_w(76), fill=RED)
-    return img
-
-
-def icon_metronome() -> Image.Image:
-    img, d = _new()
-    s = _stroke(26)
-    d.polygon([(_w(256), _w(92)), (_w(128), _w(412)), (_w(384), _w(412))], outline=WHITE, fill=(0, 0, 0, 0), width=s)
-    d.line((_w(256), _w(180), _w(338), _w(308)), fill=ORANGE, width=_stroke(24))
-    d.ellipse((_w(324), _w(292), _w(362), _w(330)), fill=ORANGE)
-    return img
-
-
-def icon_flag() -> Image.Image:
-    img, d = _new()
-    s = _stroke(24)
-    d.line((_w(146), _w(88), _w(146), _w(420)), fill=WHITE, width=s)
-    d.polygon([(_w(158), _w(110)), (_w(376), _w(154)), (_w(158), _w(210))], fill=ORANGE)
-    d.line((_w(146), _w(420), _w(222), _w(420)), fill=WHITE, width=s)
-    return img
-
-
-def icon_bpm() -> Image.Image:
-    img, d = _new()
-    s = _stroke(24)
-    d.polygon([(_w(256), _w(92)), (_w(144), _w(354)), (_w(368), _w(354))], outline=WHITE, fill=(0, 0, 0, 0), width=s)
-    d.line((_w(256), _w(184), _w(316), _w(276)), fill=ORANGE, width=_stroke(20))
-    d.ellipse((_w(300), _w(260), _w(332), _w(292)), fill=ORANGE)
-    d.line((_w(92), _w(418), _w(184), _w(418), _w(214), _w(392), _w(242), _w(436), _w(272), _w(406), _w(420), _w(406)), fill=BLUE, width=_stroke(16), joint="curve")
-    return img
-
-
-def icon_count_in() -> Image.Image:
-    img, d = _new()
-    s = _stroke(20)
-    d.arc((_w(82), _w(82), _w(430), _w(430)), start=300, end=580, fill=WHITE, width=s)
+        d.ellipse((x, 198, x + 20, 218), fill=ORANGE)
+    return d
+
+
+def icon_howto() -> _Canvas:
+    d = _new()
+    s = 30
+    _rounded_rect(d, (110, 92, 402, 424), radius=34, outline=WHITE, width=s)
+    _rounded_rect(d, (198, 58, 314, 118), radius=18, outline=WHITE, width=24)
+    d.lines([(156, 192, 292, 192), (156, 246, 272, 246), (156, 300, 292, 300)], fill=SOFT_WHITE, width=20)
+    d.ellipse((286, 174, 404, 292), outline=WHITE, width=20)
+    d.polygon([(330, 208), (330, 258), (372, 233)], fill=BLUE)
+    d.text((382, 94), "?", fill=ORANGE, font=_default_font(82))
+    return d
+
+
+def icon_record() -> _Canvas:
+    d = _new()
+    d.ellipse((108, 108, 404, 404), outline=RED, width=36)
+    d.ellipse((194, 194, 318, 318), fill=RED)
+    return d
+
+
+def icon_stop() -> _Canvas:
+    d = _new()
+    d.rounded_rectangle((128, 128, 384, 384), radius=76, fill=RED)
+    return d
+
+
+def icon_metronome() -> _Canvas:
+    d = _new()
+    s = 26
+    d.polygon([(256, 92), (128, 412), (384, 412)], outline=WHITE, fill=(0, 0, 0, 0), width=s)
+    d.line((256, 180, 338, 308), fill=ORANGE, width=24)
+    d.ellipse((324, 292, 362, 330), fill=ORANGE)
+    return d
+
+
+def icon_flag() -> _Canvas:
+    d = _new()
+    s = 24
+    d.line((146, 88, 146, 420), fill=WHITE, width=s)
+    d.polygon([(158, 110), (376, 154), (158, 210)], fill=ORANGE)
+    d.line((146, 420, 222, 420), fill=WHITE, width=s)
+    return d
+
+
+def icon_bpm() -> _Canvas:
+    d = _new()
+    s = 24
+    d.polygon([(256, 92), (144, 354), (368, 354)], outline=WHITE, fill=(0, 0, 0, 0), width=s)
+    d.line((256, 184, 316, 276), fill=ORANGE, width=20)
+    d.ellipse((300, 260, 332, 292), fill=ORANGE)
+    d.line((92, 418, 184, 418, 214, 392, 242, 436, 272, 406, 420, 406), fill=BLUE, width=16, joint="curve")
+    return d
+
+
+def icon_count_in() -> _Canvas:
+    d = _new()
+    s = 20
+    d.arc((82, 82, 430, 430), start=300, end=580, fill=WHITE, width=s)
     for i, x in enumerate((170, 230, 290, 350), start=1):
         color = ORANGE if i == 4 else SOFT_WHITE
-        d.ellipse((_w(x), _w(244), _w(x + 30), _w(274)), fill=color)
-    d.line((_w(256), _w(112), _w(256), _w(170)), fill=ORANGE, width=_stroke(16))
-    return img
-
-
-def icon_lyrics_flow() -> Image.Image:
-    img, d = _new()
-    d.line((_w(98), _w(170), _w(290), _w(170)), fill=SOFT_WHITE, width=_stroke(24))
-    d.polygon([(_w(290), _w(146)), (_w(352), _w(170)), (_w(290), _w(194))], fill=SOFT_WHITE)
-    d.line((_w(98), _w(256), _w(330), _w(256)), fill=WHITE, width=_stroke(24))
-    d.polygon([(_w(330), _w(230)), (_w(394), _w(256)), (_w(330), _w(282))], fill=BLUE)
-    d.line((_w(98), _w(340), _w(370), _w(340)), fill=SOFT_WHITE, width=_stroke(24))
-    d.polygon([(_w(370), _w(314)), (_w(434), _w(340)), (_w(370), _w(366))], fill=ORANGE)
-    return img
-
-
-def icon_about() -> Image.Image:
-    img, d = _new()
-    d.ellipse((_w(110), _w(110), _w(402), _w(402)), outline=WHITE, width=_stroke(28))
-    d.ellipse((_w(244), _w(168), _w(268), _w(192)), fill=BLUE)
-    d.line((_w(256), _w(216), _w(256), _w(330)), fill=WHITE, width=_stroke(26))
-    return img
-
-
-def icon_no_song() -> Image.Image:
-    img, d = _new()
-    _rounded_rect(d, (_w(120), _w(96), _w(318), _w(394)), radius=_w(24), outline=SOFT_WHITE, width=_stroke(26))
-    d.line((_w(338), _w(170), _w(418), _w(144), _w(418), _w(258)), fill=BLUE, width=_stroke(20), joint="curve")
-    d.ellipse((_w(312), _w(274), _w(358), _w(320)), fill=BLUE)
-    d.line((_w(118), _w(402), _w(404), _w(108)), fill=ORANGE, width=_stroke(22))
-    return img
-
-
-def icon_gender(female: bool) -> Image.Image:
-    img, d = _new()
-    s = _stroke(24)
-    d.ellipse((_w(180), _w(96), _w(332), _w(248)), outline=WHITE, width=s)
+        d.ellipse((x, 244, x + 30, 274), fill=color)
+    d.line((256, 112, 256, 170), fill=ORANGE, width=16)
+    return d
+
+
+def icon_lyrics_flow() -> _Canvas:
+    d = _new()
+    d.line((98, 170, 290, 170), fill=SOFT_WHITE, width=24)
+    d.polygon([(290, 146), (352, 170), (290, 194)], fill=SOFT_WHITE)
+    d.line((98, 256, 330, 256), fill=WHITE, width=24)
+    d.polygon([(330, 230), (394, 256), (330, 282)], fill=BLUE)
+    d.line((98, 340, 370, 340), fill=SOFT_WHITE, width=24)
+    d.polygon([(370, 314), (434, 340), (370, 366)], fill=ORANGE)
+    return d
+
+
+def icon_about() -> _Canvas:
+    d = _new()
+    d.ellipse((110, 110, 402, 402), outline=WHITE, width=28)
+    d.ellipse((244, 168, 268, 192), fill=BLUE)
+    d.line((256, 216, 256, 330), fill=WHITE, width=26)
+    return d
+
+
+def icon_no_song() -> _Canvas:
+    d = _new()
+    _rounded_rect(d, (120, 96, 318, 394), radius=24, outline=SOFT_WHITE, width=26)
+    d.line((338, 170, 418, 144, 418, 258), fill=BLUE, width=20, joint="curve")
+    d.ellipse((312, 274, 358, 320), fill=BLUE)
+    d.line((118, 402, 404, 108), fill=ORANGE, width=22)
+    return d
+
+
+def icon_gender(female: bool) -> _Canvas:
+    d = _new()
+    s = 24
+    d.ellipse((180, 96, 332, 248), outline=WHITE, width=s)
     if female:
-        d.arc((_w(158), _w(90), _w(354), _w(286)), start=205, end=335, fill=BLUE, width=_stroke(30))
+        d.arc((158, 90, 354, 286), start=205, end=335, fill=BLUE, width=30)
     else:
-        d.rounded_rectangle((_w(176), _w(90), _w(336), _w(156)), radius=_w(26), fill=BLUE)
-    d.rounded_rectangle((_w(108), _w(252), _w(404), _w(418)), radius=_w(90), outline=WHITE, width=s)
-    return img
+        d.rounded_rectangle((176, 90, 336, 156), radius=26, fill=BLUE)
+    d.rounded_rectangle((108, 252, 404, 418), radius=90, outline=WHITE, width=s)
+    return d
 
 
-def icon_beats(count: int) -> Image.Image:
-    img, d = _new()
+def icon_beats(count: int) -> _Canvas:
+    d = _new()
     spacing = 70
     total = (count - 1) * spacing
     start = 256 - total // 2
     for i in range(count):
         x = start + i * spacing
         color = ORANGE if i == count - 1 else SOFT_WHITE
-        d.ellipse((_w(x - 22), _w(220), _w(x + 22), _w(264)), fill=color)
-    d.line((_w(130), _w(320), _w(382), _w(320)), fill=WHITE, width=_stroke(18))
-    return img
+        d.ellipse((x - 22, 220, x + 22, 264), fill=color)
+    d.line((130, 320, 382, 320), fill=WHITE, width=18)
+    return d
 
 
-def icon_easepocket() -> Image.Image:
-    img, d = _new()
-    d.ellipse((_w(92), _w(86), _w(420), _w(414)), outline=SOFT_WHITE, width=_stroke(20))
-    d.line((_w(124), _w(256), _w(188), _w(256), _w(236), _w(210), _w(280), _w(302), _w(336), _w(236), _w(390), _w(236)), fill=BLUE, width=_stroke(20), joint="curve")
-    d.ellipse((_w(356), _w(146), _w(392), _w(182)), fill=ORANGE)
-    d.ellipse((_w(140), _w(318), _w(170), _w(348)), fill=(120, 120, 255, 210))
-    return img
+def icon_easepocket() -> _Canvas:
+    d = _new()
+    d.ellipse((92, 86, 420, 414), outline=SOFT_WHITE, width=20)
+    d.line((124, 256, 188, 256, 236, 210, 280, 302, 336, 236, 390, 236), fill=BLUE, width=20, joint="curve")
+    d.ellipse((356, 146, 392, 182), fill=ORANGE)
+    d.ellipse((140, 318, 170, 348), fill=PERIWINKLE)
+    return d
 
 
-ICON_BUILD: list[tuple[Path, Callable[[], Image.Image]]] = [
+ICON_BUILD: list[tuple[Path, Callable[[], _Canvas]]] = [
     (ICON_SET / "Singing.png", icon_singing),
     (ICON_SET / "Lyrics.png", icon_lyrics),
     (ICON_SET / "sessions.png", icon_sessions),
     (ICON_SET / "Profile.png", icon_profile),
     (ICON_SET / "Live_mode.png", icon_live_mode),
     (ICON_SET / "Lyrics_sync.png", icon_lyrics_sync),
-    (ICON_SET / "Feedback_intensity_high.png", lambda: icon_feedback(True)),
-    (ICON_SET / "Feedback_intensity_low.png", lambda: icon_feedback(False)),
+    (ICON_SET / "Feedback_intensity_high.png", partial(icon_feedback, True)),
+    (ICON_SET / "Feedback_intensity_low.png", partial(icon_feedback, False)),
     (ICON_SET / "Mindfullness_voice.png", icon_mindfulness_voice),
     (ICON_SET / "Language_accent.png", icon_language_accent),
     (ICON_SET / "howto-icon.png", icon_howto),
@@ -298,15 +719,38 @@ ICON_BUILD: list[tuple[Path, Callable[[], Image.Image]]] = [
     (ASSETS / "lyrics_flow_speed_icon.png", icon_lyrics_flow),
     (ASSETS / "about_icon.png", icon_about),
     (ASSETS / "nosong_state.png", icon_no_song),
-    (ASSETS / "Female.png", lambda: icon_gender(True)),
-    (ASSETS / "Male.png", lambda: icon_gender(False)),
-    (ASSETS / "two_beats.png", lambda: icon_beats(2)),
-    (ASSETS / "four_beats.png", lambda: icon_beats(4)),
+    (ASSETS / "Female.png", partial(icon_gender, True)),
+    (ASSETS / "Male.png", partial(icon_gender, False)),
+    (ASSETS / "two_beats.png", partial(icon_beats, 2)),
+    (ASSETS / "four_beats.png", partial(icon_beats, 4)),
     (ASSETS / "EasePocket.png", icon_easepocket),
 ]
 
 
+def _worker_init() -> None:
+    # Load the text font and start Numba's thread pool before the first job.
+    _default_font(82)
+    _render(np.zeros((0, SHAPE_COLUMNS), np.float32))
+
+
+def _build_and_save(job: tuple[Path, Callable[[], _Canvas]]) -> Path:
+    # Builders are module-level functions (or partials of them) so they pickle
+    # into worker processes; each one writes a distinct file.
+    target, builder = job
+    _save(builder(), target)
+    return target
+
+
 if __name__ == "__main__":
-    for target, builder in ICON_BUILD:
-        _save(builder(), target)
-        print(f"generated {target.relative_to(ROOT)}")
+    # Numba's parallel thread pool is not fork-safe, so workers never fork this
+    # process. A fork server that has imported this module (and loaded the
+    # compiled kernel) but never rendered hands each worker the loaded modules;
+    # where it is unavailable, workers are spawned and re-import them.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["__main__"])
+    else:
+        context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(mp_context=context, initializer=_worker_init) as executor:
+        for target in executor.map(_build_and_save, ICON_BUILD):
+            print(f"generated {target.relative_to(ROOT)}")
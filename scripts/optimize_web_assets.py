@@ -7,18 +7,34 @@ optimized assets automatically on web while native keeps original files.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+import io
+import json
+import os
 from pathlib import Path
 import shutil
+import subprocess
 from typing import Iterable
 
+import numpy as np
+import PIL
 from PIL import Image
 
 
 ROOT = Path(__file__).resolve().parent.parent
 IMAGES_ROOT = ROOT / "assets" / "images"
-SKIP_PREFIXES = {
+# Records each source's mtime/size and the size of its optimized copy so that
+# unchanged files are skipped on the next run.
+CACHE_PATH = IMAGES_ROOT / ".web-optimize-cache.json"
+# Bump whenever the optimizer's output changes so cached files are redone.
+CACHE_VERSION = 1
+# Sources smaller than this are copied as is: a decode + re-encode costs far
+# more than the few bytes it could save.
+COPY_BELOW_BYTES = 1024
+# A tuple so `str.startswith` can test every prefix in one call.
+SKIP_PREFIXES = (
     "assets/images/web/",
-}
+)
 SKIP_EXACT = {
     "assets/images/android-icon-background.png",
     "assets/images/android-icon-foreground.png",
@@ -42,7 +58,7 @@ def human_size(size: int) -> str:
 
 def should_process(path: Path) -> bool:
     rel = path.relative_to(ROOT).as_posix()
-    if any(rel.startswith(prefix) for prefix in SKIP_PREFIXES):
+    if rel.startswith(SKIP_PREFIXES):
         return False
     if rel in SKIP_EXACT:
         return False
@@ -51,43 +67,165 @@ def should_process(path: Path) -> bool:
     return True
 
 
+def walk_pngs(directory: Path) -> Iterable[Path]:
+    # Skipped subtrees are pruned here instead of being walked and filtered.
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            path = Path(entry.path)
+            if entry.is_dir(follow_symlinks=False):
+                if not f"{path.relative_to(ROOT).as_posix()}/".startswith(SKIP_PREFIXES):
+                    yield from walk_pngs(path)
+            elif entry.name.endswith(".png"):
+                yield path
+
+
 def discover_sources() -> list[Path]:
-    sources = [p for p in IMAGES_ROOT.rglob("*.png") if should_process(p)]
+    sources = [p for p in walk_pngs(IMAGES_ROOT) if should_process(p)]
     return sorted(sources)
 
 
+def web_path(src: Path) -> Path:
+    return src.with_name(f"{src.stem}.web.png")
+
+
+def cache_settings() -> dict[str, str | int | None]:
+    # Everything besides the source that decides the optimized bytes; a change
+    # to any of it invalidates the whole manifest.
+    oxipng = shutil.which("oxipng")
+    if oxipng is not None:
+        oxipng = subprocess.run([oxipng, "--version"], capture_output=True, text=True, check=True).stdout.strip()
+    return {"version": CACHE_VERSION, "pillow": PIL.__version__, "oxipng": oxipng}
+
+
+def load_cache(settings: dict[str, str | int | None]) -> dict[str, dict[str, int]]:
+    try:
+        cache = json.loads(CACHE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("settings") != settings:
+        return {}
+    return cache.get("files", {})
+
+
+def is_cached(src: Path, entry: dict[str, int] | None) -> bool:
+    if entry is None:
+        return False
+    stat = src.stat()
+    dst = web_path(src)
+    return (
+        entry.get("src_mtime") == stat.st_mtime_ns
+        and entry.get("src_size") == stat.st_size
+        and dst.exists()
+        and entry.get("dst_size") == dst.stat().st_size
+    )
+
+
+def _encode(image: Image.Image, **params) -> bytes:
+    buf = io.BytesIO()
+    image.save(buf, format="PNG", **params)
+    return buf.getvalue()
+
+
+def to_palette(image: Image.Image) -> Image.Image | None:
+    # Flat-color art with at most 256 distinct colors fits a PNG8 palette
+    # (alpha goes into tRNS), which is far smaller than truecolor. The palette
+    # is built from the exact color list, so the conversion stays lossless.
+    if image.getcolors(maxcolors=256) is None:
+        return None
+    # Pixels are packed into one integer each and indexed in NumPy, which
+    # releases the GIL so the optimizer threads run in parallel.
+    pixels = np.asarray(image).reshape(-1, len(image.mode)).astype(np.uint32)
+    packed = np.zeros(len(pixels), np.uint32)
+    for channel in range(pixels.shape[1]):
+        packed |= pixels[:, channel] << (8 * channel)
+    keys, indices = np.unique(packed, return_inverse=True)
+    palette = np.stack([(keys >> (8 * channel)) & 0xFF for channel in range(pixels.shape[1])], axis=1)
+    paletted = Image.frombytes("P", image.size, indices.astype(np.uint8).tobytes())
+    paletted.putpalette(palette.astype(np.uint8).tobytes(), rawmode=image.mode)
+    # An RGB color key becomes a fully transparent palette entry.
+    key = image.info.get("transparency")
+    if image.mode == "RGB" and key is not None:
+        paletted.info["transparency"] = bytes(0 if tuple(color) == key else 255 for color in palette)
+    return paletted
+
+
 def optimize(src: Path) -> tuple[Path, int, int]:
-    dst = src.with_name(f"{src.stem}.web.png")
+    dst = web_path(src)
     before = src.stat().st_size
-    with Image.open(src) as image:
-        optimized = image.convert("RGBA") if "A" in image.getbands() else image.convert("RGB")
-        optimized.save(dst, format="PNG", optimize=True, compress_level=9)
+    if before < COPY_BELOW_BYTES:
+        shutil.copyfile(src, dst)
+        return dst, before, before
 
-    after = dst.stat().st_size
-    if after > before:
+    with Image.open(src) as image:
+        # Modes PNG stores natively are encoded as is: no pixel copy, and
+        # paletted sources keep their palette and tRNS chunk.
+        if image.mode in ("P", "L", "LA", "RGB", "RGBA"):
+            optimized = image
+        else:
+            optimized = image.convert("RGBA" if image.has_transparency_data else "RGB")
+        if optimized.mode in ("RGB", "RGBA"):
+            optimized = to_palette(optimized) or optimized
+        encoded = _encode(optimized, optimize=True, compress_level=9)
+
+    if len(encoded) < before:
+        dst.write_bytes(encoded)
+    else:
         # Keep quality identical and avoid size regressions.
         shutil.copyfile(src, dst)
-        after = dst.stat().st_size
+    after = dst.stat().st_size
 
     return dst, before, after
 
 
+def recompress(paths: list[Path]) -> None:
+    # oxipng's zopfli + filter search beats zlib level 9 losslessly. It is
+    # optional: without it the Pillow output is kept as is. One invocation
+    # covers the batch, oxipng parallelizes across files and never writes a
+    # result larger than its input.
+    oxipng = shutil.which("oxipng")
+    if oxipng is None or not paths:
+        return
+    subprocess.run(
+        [oxipng, "--quiet", "-o", "max", "--strip", "safe", "-Z", *(str(path) for path in paths)],
+        check=True,
+    )
+
+
 def run(sources: Iterable[Path]) -> int:
     print("Optimizing web icon assets:")
     total_before = 0
     total_after = 0
     count = 0
 
+    sources = list(sources)
+    settings = cache_settings()
+    cache = load_cache(settings)
+    stale = [src for src in sources if not is_cached(src, cache.get(src.relative_to(ROOT).as_posix()))]
+    # zlib releases the GIL while deflating, so threads are enough to keep
+    # every core busy.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(optimize, stale))
+    recompress([dst for dst, _, _ in results])
+
+    updated: dict[str, dict[str, int]] = {}
     for src in sources:
-        dst, before, after = optimize(src)
+        dst = web_path(src)
+        stat = src.stat()
+        before = stat.st_size
+        after = dst.stat().st_size
+        rel = src.relative_to(ROOT).as_posix()
+        updated[rel] = {"src_mtime": stat.st_mtime_ns, "src_size": before, "dst_size": after}
         total_before += before
         total_after += after
         reduction = 0.0 if before == 0 else (1 - after / before) * 100
+        note = "" if src in stale else " (unchanged)"
         print(
             f"- {src.relative_to(ROOT)} -> {dst.relative_to(ROOT)}: "
-            f"{human_size(before)} -> {human_size(after)} ({reduction:.1f}% smaller)"
+            f"{human_size(before)} -> {human_size(after)} ({reduction:.1f}% smaller){note}"
         )
         count += 1
+    manifest = {"settings": settings, "files": updated}
+    CACHE_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n")
 
     total_reduction = 0.0 if total_before == 0 else (1 - total_after / total_before) * 100
     print(